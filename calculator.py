@@ -1,11 +1,10 @@
 import tkinter as tk
-from tkinter import font as tkfont
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional, List, Callable
+from functools import lru_cache
 import operator
 import re
-import
 
 @dataclass(frozen=True)
 class ThemeColors:
@@ -44,51 +43,37 @@ class SafeExpressionEvaluator:
     PRECEDENCE: dict[str, int] = {'+': 1, '-': 1, '*': 2, '/': 2}
     
     @classmethod
+    @lru_cache(maxsize=256)
     def evaluate(cls, expression: str) -> float:
-        tokens = cls._tokenize(expression)
-        if not tokens:
-            raise ValueError("Empty expression")
-        return cls._parse_expression(tokens)
-    
-    @classmethod
-    def _tokenize(cls, expression: str) -> List[str]:
-        expression = expression.replace(" ", "")
-        tokens: List[str] = []
+        output_queue: List[float] = []
+        operator_stack: List[str] = []
         current_number = ""
+        precedence = cls.PRECEDENCE
         
-        for i, char in enumerate(expression):
+        for char in expression:
             if char.isdigit() or char == '.':
                 current_number += char
-            elif char in cls.OPERATORS:
-                if char == '-' and (not tokens or tokens[-1] in cls.OPERATORS):
-                    current_number += char
-                else:
-                    if current_number:
-                        tokens.append(current_number)
-                        current_number = ""
-                    tokens.append(char)
-            else:
+            elif char in precedence:
+                if not current_number:
+                    if char != '-':
+                        raise ValueError("Invalid expression")
+                    current_number = char
+                    continue
+                
+                output_queue.append(float(current_number))
+                current_number = ""
+                
+                char_precedence = precedence[char]
+                while operator_stack and precedence[operator_stack[-1]] >= char_precedence:
+                    cls._apply_operator(output_queue, operator_stack.pop())
+                operator_stack.append(char)
+            elif char != ' ':
                 raise ValueError(f"Invalid character: {char}")
         
         if current_number:
-            tokens.append(current_number)
-            
-        return tokens
-    
-    @classmethod
-    def _parse_expression(cls, tokens: List[str]) -> float:
-        output_queue: List[float] = []
-        operator_stack: List[str] = []
-        
-        for token in tokens:
-            if token not in cls.OPERATORS:
-                output_queue.append(float(token))
-            else:
-                while (operator_stack and 
-                       operator_stack[-1] in cls.OPERATORS and
-                       cls.PRECEDENCE[operator_stack[-1]] >= cls.PRECEDENCE[token]):
-                    cls._apply_operator(output_queue, operator_stack.pop())
-                operator_stack.append(token)
+            output_queue.append(float(current_number))
+        elif not output_queue:
+            raise ValueError("Empty expression")
         
         while operator_stack:
             cls._apply_operator(output_queue, operator_stack.pop())
@@ -106,7 +91,25 @@ class SafeExpressionEvaluator:
         output.append(cls.OPERATORS[op](a, b))
 
 
+def _on_hover_enter(event: tk.Event) -> None:
+    event.widget.configure(bg=event.widget.hover_bg)
+
+
+def _on_hover_leave(event: tk.Event) -> None:
+    event.widget.configure(bg=event.widget.normal_bg)
+
+
 class CalculatorButton:
+    HOVER_TAG = "CalculatorButton"
+    
+    COLOR_ATTRS: dict[ButtonType, tuple[str, str]] = {
+        ButtonType.NUMBER: ("number_btn", "number_hover"),
+        ButtonType.OPERATOR: ("operator_btn", "operator_hover"),
+        ButtonType.EQUALS: ("equals_btn", "equals_hover"),
+        ButtonType.CLEAR: ("clear_btn", "clear_hover"),
+        ButtonType.FUNCTION: ("operator_btn", "operator_hover"),
+    }
+    
     def __init__(
         self,
         parent: tk.Frame,
@@ -146,23 +149,27 @@ class CalculatorButton:
         self._bind_hover_events()
     
     def _get_colors(self, button_type: ButtonType) -> tuple[str, str]:
-        color_map = {
-            ButtonType.NUMBER: (self.theme.number_btn, self.theme.number_hover),
-            ButtonType.OPERATOR: (self.theme.operator_btn, self.theme.operator_hover),
-            ButtonType.EQUALS: (self.theme.equals_btn, self.theme.equals_hover),
-            ButtonType.CLEAR: (self.theme.clear_btn, self.theme.clear_hover),
-            ButtonType.FUNCTION: (self.theme.operator_btn, self.theme.operator_hover),
-        }
-        return color_map.get(button_type, (self.theme.number_btn, self.theme.number_hover))
+        bg_attr, hover_attr = self.COLOR_ATTRS.get(button_type, ("number_btn", "number_hover"))
+        return getattr(self.theme, bg_attr), getattr(self.theme, hover_attr)
     
     def _bind_hover_events(self) -> None:
-        self.widget.bind("<Enter>", lambda e: self.widget.configure(bg=self.hover_color))
-        self.widget.bind("<Leave>", lambda e: self.widget.configure(bg=self.bg_color))
+        self.widget.hover_bg = self.hover_color
+        self.widget.normal_bg = self.bg_color
+        
+        tags = self.widget.bindtags()
+        self.widget.bindtags(tags[:1] + (self.HOVER_TAG,) + tags[1:])
+        
+        if not self.widget.bind_class(self.HOVER_TAG, "<Enter>"):
+            self.widget.bind_class(self.HOVER_TAG, "<Enter>", _on_hover_enter)
+            self.widget.bind_class(self.HOVER_TAG, "<Leave>", _on_hover_leave)
 
 
 class Calculator:
     SYMBOL_MAP: dict[str, str] = {"÷": "/", "×": "*", "−": "-"}
     REVERSE_SYMBOL_MAP: dict[str, str] = {v: k for k, v in SYMBOL_MAP.items()}
+    SYMBOL_TRANSLATION: dict[int, str] = str.maketrans(SYMBOL_MAP)
+    OPERATOR_PATTERN: re.Pattern[str] = re.compile("[÷×−+]")
+    OPERATOR_CHARS: frozenset[str] = frozenset("÷×−+.")
     
     KEY_BINDINGS: dict[str, str] = {
         "0": "0", "1": "1", "2": "2", "3": "3", "4": "4",
@@ -173,10 +180,29 @@ class Calculator:
         "percent": "%", "p": "%",
     }
     
+    HISTORY_KEYS: dict[str, int] = {"Up": -1, "Down": 1}
+    
+    WINDOW_WIDTH: int = 350
+    WINDOW_HEIGHT: int = 550
+    
+    BUTTON_LAYOUT: tuple[tuple[tuple[str, ButtonType], ...], ...] = (
+        (("C", ButtonType.CLEAR), ("±", ButtonType.FUNCTION), 
+         ("%", ButtonType.FUNCTION), ("÷", ButtonType.OPERATOR)),
+        (("7", ButtonType.NUMBER), ("8", ButtonType.NUMBER), 
+         ("9", ButtonType.NUMBER), ("×", ButtonType.OPERATOR)),
+        (("4", ButtonType.NUMBER), ("5", ButtonType.NUMBER), 
+         ("6", ButtonType.NUMBER), ("−", ButtonType.OPERATOR)),
+        (("1", ButtonType.NUMBER), ("2", ButtonType.NUMBER), 
+         ("3", ButtonType.NUMBER), ("+", ButtonType.OPERATOR)),
+        (("0", ButtonType.NUMBER), (".", ButtonType.NUMBER), 
+         ("⌫", ButtonType.CLEAR), ("=", ButtonType.EQUALS)),
+    )
+    
     def __init__(self, theme: Optional[ThemeColors] = None) -> None:
         self.theme = theme or ThemeColors()
-        self.current_input: str = ""
-        self.history: List[str] = []
+        self._buffer: List[str] = []
+        self._input: str = ""
+        self.history: Optional[List[str]] = None
         self.history_index: int = -1
         
         self._setup_window()
@@ -186,10 +212,19 @@ class Calculator:
         self._create_buttons()
         self._bind_keyboard()
     
+    @property
+    def current_input(self) -> str:
+        return self._input
+    
+    @current_input.setter
+    def current_input(self, value: str) -> None:
+        self._buffer = list(value)
+        self._input = value
+    
     def _setup_window(self) -> None:
         self.window = tk.Tk()
         self.window.title("🧮 Modern Calculator")
-        self.window.geometry("350x550")
+        self.window.geometry(f"{self.WINDOW_WIDTH}x{self.WINDOW_HEIGHT}")
         self.window.resizable(False, False)
         self.window.configure(bg=self.theme.background)
         
@@ -200,7 +235,8 @@ class Calculator:
     
     def _setup_variables(self) -> None:
         self.display_text = tk.StringVar(value="0")
-        self.history_text = tk.StringVar(value="")
+        self._last_display = "0"
+        self.history_text: Optional[tk.StringVar] = None
     
     def _create_display(self) -> None:
         display_frame = tk.Frame(
@@ -225,9 +261,9 @@ class Calculator:
         history_frame = tk.Frame(self.window, bg=self.theme.history_bg)
         history_frame.pack(fill="x", padx=10, pady=(0, 5))
         
-        history_label = tk.Label(
+        self.history_label = tk.Label(
             history_frame,
-            textvariable=self.history_text,
+            text="",
             font=("SF Pro Display", 14),
             bg=self.theme.history_bg,
             fg=self.theme.history_text,
@@ -235,31 +271,25 @@ class Calculator:
             padx=20,
             pady=5
         )
-        history_label.pack(fill="both")
+        self.history_label.pack(fill="both")
+    
+    def _init_history(self) -> tuple[List[str], tk.StringVar]:
+        if self.history is None or self.history_text is None:
+            self.history = []
+            self.history_text = tk.StringVar(value="")
+            self.history_label.configure(textvariable=self.history_text)
+        return self.history, self.history_text
     
     def _create_buttons(self) -> None:
         button_frame = tk.Frame(self.window, bg=self.theme.background)
         button_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
-        layout: List[List[tuple[str, ButtonType]]] = [
-            [("C", ButtonType.CLEAR), ("±", ButtonType.FUNCTION), 
-             ("%", ButtonType.FUNCTION), ("÷", ButtonType.OPERATOR)],
-            [("7", ButtonType.NUMBER), ("8", ButtonType.NUMBER), 
-             ("9", ButtonType.NUMBER), ("×", ButtonType.OPERATOR)],
-            [("4", ButtonType.NUMBER), ("5", ButtonType.NUMBER), 
-             ("6", ButtonType.NUMBER), ("−", ButtonType.OPERATOR)],
-            [("1", ButtonType.NUMBER), ("2", ButtonType.NUMBER), 
-             ("3", ButtonType.NUMBER), ("+", ButtonType.OPERATOR)],
-            [("0", ButtonType.NUMBER), (".", ButtonType.NUMBER), 
-             ("⌫", ButtonType.CLEAR), ("=", ButtonType.EQUALS)],
-        ]
-        
         for i in range(5):
             button_frame.grid_rowconfigure(i, weight=1)
         for i in range(4):
             button_frame.grid_columnconfigure(i, weight=1)
         
-        for row_idx, row in enumerate(layout):
+        for row_idx, row in enumerate(self.BUTTON_LAYOUT):
             for col_idx, (text, btn_type) in enumerate(row):
                 CalculatorButton(
                     parent=button_frame,
@@ -273,15 +303,12 @@ class Calculator:
     
     def _bind_keyboard(self) -> None:
         self.window.bind("<Key>", self._on_key_press)
-        self.window.bind("<Return>", lambda e: self._on_button_click("="))
-        self.window.bind("<BackSpace>", lambda e: self._on_button_click("⌫"))
-        self.window.bind("<Escape>", lambda e: self._on_button_click("C"))
-        self.window.bind("<Up>", lambda e: self._navigate_history(-1))
-        self.window.bind("<Down>", lambda e: self._navigate_history(1))
     
     def _on_key_press(self, event: tk.Event) -> None:
         key = event.keysym if len(event.keysym) > 1 else event.char
-        if key in self.KEY_BINDINGS:
+        if key in self.HISTORY_KEYS:
+            self._navigate_history(self.HISTORY_KEYS[key])
+        elif key in self.KEY_BINDINGS:
             self._on_button_click(self.KEY_BINDINGS[key])
         elif key.isdigit():
             self._on_button_click(key)
@@ -291,10 +318,12 @@ class Calculator:
             return
         
         new_index = self.history_index + direction
-        if 0 <= new_index < len(self.history):
-            self.history_index = new_index
-            self.current_input = self.history[self.history_index]
-            self.display_text.set(self.current_input)
+        if not 0 <= new_index < len(self.history):
+            return
+        
+        self.history_index = new_index
+        self.current_input = self.history[new_index]
+        self._set_display(self.current_input)
     
     def _on_button_click(self, button_text: str) -> None:
         handlers: dict[str, Callable[[], None]] = {
@@ -310,15 +339,23 @@ class Calculator:
         else:
             self._append_to_input(button_text)
     
+    def _set_display(self, text: str) -> None:
+        if text != self._last_display:
+            self.display_text.set(text)
+            self._last_display = text
+    
     def _clear(self) -> None:
         self.current_input = ""
-        self.display_text.set("0")
-        self.history_text.set("")
+        self._set_display("0")
+        if self.history_text is not None:
+            self.history_text.set("")
         self.history_index = -1
     
     def _backspace(self) -> None:
-        self.current_input = self.current_input[:-1]
-        self.display_text.set(self.current_input if self.current_input else "0")
+        if self._buffer:
+            self._buffer.pop()
+            self._input = "".join(self._buffer)
+        self._set_display(self.current_input if self.current_input else "0")
     
     def _toggle_sign(self) -> None:
         if not self.current_input or self.current_input == "0":
@@ -329,80 +366,70 @@ class Calculator:
         else:
             self.current_input = "-" + self.current_input
         
-        self.display_text.set(self.current_input)
+        self._set_display(self.current_input)
     
     def _percentage(self) -> None:
         if not self.current_input:
             return
         
         try:
-            expression = self._to_internal_format(self.current_input)
-            result = SafeExpressionEvaluator.evaluate(expression) / 100
+            result = self._evaluate(self.current_input) / 100
             self.current_input = str(result)
-            self.display_text.set(self._format_result(result))
+            self._set_display(self._format_result(result))
         except (ValueError, ZeroDivisionError):
             pass
     
     def _append_to_input(self, char: str) -> None:
-        operators = "÷×−+."
-        
-        if char in operators and self.current_input:
-            if self.current_input[-1] in operators:
+        if char in self.OPERATOR_CHARS and self.current_input:
+            if self.current_input[-1] in self.OPERATOR_CHARS:
                 return
         
-        if char == ".":
-            parts = self.current_input
-            for op in "÷×−+":
-                parts = parts.replace(op, " ")
-            last_number = parts.split()[-1] if parts.split() else ""
-            if "." in last_number:
-                return
+        if char == "." and "." in self.OPERATOR_PATTERN.split(self.current_input)[-1]:
+            return
         
-        self.current_input += char
-        self.display_text.set(self.current_input)
+        self._buffer.append(char)
+        self._input = "".join(self._buffer)
+        self._set_display(self.current_input)
     
     def _to_internal_format(self, expression: str) -> str:
-        for display_sym, internal_sym in self.SYMBOL_MAP.items():
-            expression = expression.replace(display_sym, internal_sym)
-        return expression
+        return expression.translate(self.SYMBOL_TRANSLATION)
+    
+    def _evaluate(self, expression: str) -> float:
+        return SafeExpressionEvaluator.evaluate(self._to_internal_format(expression))
     
     def _calculate(self) -> None:
         if not self.current_input:
             return
         
         expression = self.current_input
-        internal_expr = self._to_internal_format(expression)
         
         try:
-            result = SafeExpressionEvaluator.evaluate(internal_expr)
+            result = self._evaluate(expression)
             formatted = self._format_result(result)
             
-            self.history_text.set(f"{expression} =")
-            self.history.append(expression)
-            self.history_index = len(self.history)
+            history, history_text = self._init_history()
+            history_text.set(f"{expression} =")
+            history.append(expression)
+            self.history_index = len(history)
             
             self.current_input = str(result)
-            self.display_text.set(formatted)
+            self._set_display(formatted)
             
         except ZeroDivisionError:
-            self.display_text.set("Error: ÷ by 0")
+            self._set_display("Error: ÷ by 0")
             self.current_input = ""
         except ValueError:
-            self.display_text.set("Error")
+            self._set_display("Error")
             self.current_input = ""
     
     def _format_result(self, result: float) -> str:
-        if isinstance(result, float) and result == int(result):
+        if result.is_integer() and abs(result) < 1e15:
             return str(int(result))
-        
-        formatted = f"{result:.10g}"
-        return formatted
+        return format(result, ".10g")
     
     def run(self) -> None:
-        self.window.update_idletasks()
-        
-        width = self.window.winfo_width()
-        height = self.window.winfo_height()
+        width = self.WINDOW_WIDTH
+        height = self.WINDOW_HEIGHT
         screen_width = self.window.winfo_screenwidth()
         screen_height = self.window.winfo_screenheight()
         x = (screen_width // 2) - (width // 2)